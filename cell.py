@@ -1,43 +1,24 @@
 """
 Cell Module
 
-Represents a single cell in the game grid.
-Each cell can contain a bomb or be empty, and can be revealed or hidden.
-"""
-
-
-class Cell:
-    """
-    Represents a single cell in the game grid.
+Encodings for the per-cell state stored by the game grid.
 
-    A cell can:
-    - Contain a bomb (item_type = ('P', 'B') for player or ('A', 'B') for AI)
-    - Be revealed or hidden
-    - Track who revealed it (for color coding)
-    """
-
-    def __init__(self):
-        """Initialize a new cell as empty and unrevealed."""
-        self.revealed = False  # Whether this cell has been revealed
-        self.item_type = None  # ('P', 'B') or ('A', 'B') if bomb, None if empty
-        self.revealed_by = None  # 'player' or 'ai' - who revealed this cell
-
-    def add_item(self, item):
-        """
-        Place an item (bomb) in this cell.
+The grid keeps cell state as parallel flat buffers (one byte per cell)
+rather than one Python object per cell. These constants are the values
+stored in those buffers.
+"""
 
-        Args:
-            item: Tuple like ('P', 'B') for player bomb or ('A', 'B') for AI bomb
-        """
-        self.item_type = item
+# Item stored in a cell (Grid.item_kind)
+EMPTY = 0  # No item
+P_BOMB = 1  # Player's bomb ('P')
+A_BOMB = 2  # AI's bomb ('A')
 
-    def reveal(self, revealed_by):
-        """
-        Mark this cell as revealed.
+# Who revealed a cell (Grid.revealed_by); 0 means not revealed
+REVEALED_BY_PLAYER = 1
+REVEALED_BY_AI = 2
 
-        Args:
-            revealed_by: 'player' or 'ai' - who revealed this cell
-        """
-        self.revealed = True
-        self.revealed_by = revealed_by
+# Letter drawn on a revealed bomb cell, indexed by item kind
+ITEM_LETTERS = (None, 'P', 'A')
 
+# Map the public 'player'/'ai' revealer names to their stored codes
+REVEALER_CODES = {'player': REVEALED_BY_PLAYER, 'ai': REVEALED_BY_AI}
@@ -5,17 +5,54 @@ Generates cyberpunk-themed images for mission briefing and outcome screens.
 Uses Google AI Studio API (Gemini) or Vertex AI Imagen for image generation.
 """
 
-import os
+import base64
+import hashlib
+import queue
+import threading
 from io import BytesIO
-from dotenv import load_dotenv
+from pathlib import Path
 
-load_dotenv()
+import requests
+from PIL import Image, ImageDraw
+from requests.adapters import HTTPAdapter
 
-# Google Cloud Configuration
-USE_VERTEX_AI = os.getenv("USE_VERTEX_AI", "false").lower() == "true"
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT")
-LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
+from config import USE_VERTEX_AI, GEMINI_API_KEY, PROJECT_ID, LOCATION
+
+# Image prompt templates ({0} is the start of the story text)
+BRIEFING_PROMPT_TEMPLATE = """Create a cyberpunk anime-style poster illustration depicting: {0}
+            
+Style: Retro-futuristic cyberpunk aesthetic, animated character art style, neon colors (cyan, purple, green), 
+dark backgrounds, glowing effects, terminal/CRT screen aesthetic, dramatic lighting, action-oriented composition.
+The image should show animated-looking characters in a cyberpunk setting."""
+
+OUTCOME_PROMPT_TEMPLATE = """Create a cyberpunk anime-style poster illustration depicting the mission outcome: {0}
+            
+Style: Retro-futuristic cyberpunk aesthetic, animated character art style, neon colors (cyan, purple, red/green based on outcome), 
+dark backgrounds, glowing effects, terminal/CRT screen aesthetic, dramatic lighting, cinematic composition.
+The image should show animated-looking characters in a cyberpunk setting representing the mission result."""
+
+# Gemini image-capable model endpoints (include higher-quota preview)
+GEMINI_IMAGE_MODELS = (
+    "gemini-2.0-flash-preview-image-generation",  # recommended for higher quota
+    "gemini-2.5-flash-image",
+    "gemini-2.0-flash-exp",
+)
+# Per-model (connect, read) timeout in seconds; models are tried concurrently
+GEMINI_IMAGE_TIMEOUT = (5, 20)
+
+# Generated images are cached here, keyed by a hash of the prompt input
+IMAGE_CACHE_DIR = Path(__file__).resolve().parent / ".img_cache"
+# Most cached images kept on disk; the oldest are deleted beyond this
+IMAGE_CACHE_MAX_FILES = 50
+
+# Shared HTTP session so retries reuse the same keep-alive connection
+_session = None
+
+# Grid-line masks for the placeholder image, keyed by (width, height, spacing)
+_grid_masks = {}
+
+# Drawn placeholder images, keyed by image type ("briefing" / "outcome")
+_placeholder_templates = {}
 
 
 def generate_mission_image(story_text, image_type="briefing"):
@@ -30,16 +67,182 @@ def generate_mission_image(story_text, image_type="briefing"):
     Returns:
         PIL Image object or None if generation fails
     """
+    # Reuse a previously generated image for the same prompt
+    cache_path = _get_cache_path(story_text, image_type)
+    cached = _load_cached_image(cache_path)
+    if cached is not None:
+        return cached
+    
+    result = None
     # Try Gemini Flash via Google AI Studio first if API key is available
     if GEMINI_API_KEY and not USE_VERTEX_AI:
-        return _generate_with_gemini(story_text, image_type)
-    
+        result = _generate_with_gemini(story_text, image_type)
     # Try Vertex AI Imagen if configured
-    if USE_VERTEX_AI and PROJECT_ID:
-        return _generate_with_imagen(story_text, image_type)
+    elif USE_VERTEX_AI and PROJECT_ID:
+        result = _generate_with_imagen(story_text, image_type)
+    
+    # None means fallback to enhanced placeholder
+    if result is None:
+        return None
+    image, image_bytes = result
+    _save_cached_image(image_bytes, cache_path)
+    return image
+
+
+def _get_cache_path(story_text, image_type="briefing"):
+    """
+    Get the disk cache path for a generated image.
+    
+    The key covers exactly what goes into the prompt (image type and the
+    first 200 characters of the story), so identical prompts share a file.
+    
+    Args:
+        story_text: The story text the image is based on
+        image_type: "briefing" or "outcome"
+    
+    Returns:
+        pathlib.Path of the cached image file
+    """
+    key = hashlib.blake2b(f"{image_type}:{story_text[:200]}".encode("utf-8"), digest_size=16).hexdigest()
+    return IMAGE_CACHE_DIR / f"{key}.img"
+
+
+def _load_cached_image(cache_path):
+    """
+    Load an image from the disk cache.
+    
+    Args:
+        cache_path: Path returned by _get_cache_path
+    
+    Returns:
+        PIL Image object or None if not cached (or unreadable)
+    """
+    if not cache_path.exists():
+        return None
+    try:
+        image = Image.open(cache_path)
+        image.load()
+        return image
+    except OSError as e:
+        print(f"Ignoring unreadable cached image {cache_path}: {e}")
+        return None
+
+
+def _save_cached_image(image_bytes, cache_path):
+    """
+    Store a generated image in the disk cache. Failures are only logged.
+    
+    The encoded bytes the API returned are written as-is, so caching never
+    re-encodes the image. The oldest files are removed once the cache holds
+    more than IMAGE_CACHE_MAX_FILES images.
+    
+    Args:
+        image_bytes: Encoded image data (PNG, JPEG, ...)
+        cache_path: Path returned by _get_cache_path
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(image_bytes)
+        cached_files = sorted(cache_path.parent.glob("*.img"), key=lambda path: path.stat().st_mtime)
+        for old_path in cached_files[:-IMAGE_CACHE_MAX_FILES]:
+            old_path.unlink()
+    except OSError as e:
+        print(f"Could not cache generated image: {e}")
+
+
+def _build_prompt(story_text, image_type="briefing"):
+    """
+    Build the image generation prompt for a story.
+    
+    Args:
+        story_text: The story text to base the image on
+        image_type: "briefing" for opening story, "outcome" for ending story
+    
+    Returns:
+        Prompt string
+    """
+    if image_type == "briefing":
+        return BRIEFING_PROMPT_TEMPLATE.format(story_text[:200])
+    return OUTCOME_PROMPT_TEMPLATE.format(story_text[:200])  # outcome
+
+
+def _open_image(image_bytes):
+    """
+    Decode encoded image bytes into a fully loaded PIL Image.
+    
+    PIL decodes lazily, so without load() the pixel data would only be
+    decoded later on the main thread. Loading here keeps the decode on
+    the background thread and lets the encoded buffer be freed right away.
+    
+    Args:
+        image_bytes: Encoded image data (PNG, JPEG, ...)
+    
+    Returns:
+        PIL Image object
+    """
+    image = Image.open(BytesIO(image_bytes))
+    image.load()
+    return image
+
+
+def _get_session():
+    """
+    Get the shared HTTP session for Google AI Studio requests.
+    
+    Created on first use so the TCP/TLS connection is set up once and
+    reused across model fallbacks and later image requests.
     
-    # Fallback to enhanced placeholder
-    return None
+    Returns:
+        requests.Session instance
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _session
+
+
+def _request_gemini_image(session, model_name, headers, payload):
+    """
+    Request an image from a single Gemini image model.
+    
+    Args:
+        session: HTTP session to send the request with
+        model_name: Gemini model to ask
+        headers: Request headers
+        payload: JSON request body
+    
+    Returns:
+        (PIL Image, encoded image bytes) or None if this model did not return an image
+    """
+    try:
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={GEMINI_API_KEY}"
+        response = session.post(url, headers=headers, json=payload, timeout=GEMINI_IMAGE_TIMEOUT)
+        
+        if response.status_code != 200:
+            print(f"Gemini API error ({model_name}): {response.status_code} - {response.text}")
+            return None
+        
+        data = response.json()
+        
+        # Extract image from the first candidate's parts
+        candidates = data.get("candidates") or ()
+        parts = candidates[0].get("content", {}).get("parts", ()) if candidates else ()
+        for part in parts:
+            inline_data = part.get("inlineData")
+            if inline_data is not None:
+                image_data = base64.b64decode(inline_data["data"])
+                return _open_image(image_data), image_data
+            image_data = part.get("data")
+            if image_data is not None:
+                # Try direct data
+                if isinstance(image_data, str):
+                    image_data = base64.b64decode(image_data)
+                return _open_image(image_data), image_data
+        return None
+    except Exception as e:
+        print(f"Error generating image with Gemini ({model_name}): {e}")
+        return None
 
 
 def _generate_with_gemini(story_text, image_type="briefing"):
@@ -51,38 +254,14 @@ def _generate_with_gemini(story_text, image_type="briefing"):
         image_type: "briefing" for opening story, "outcome" for ending story
     
     Returns:
-        PIL Image object or None if generation fails
+        (PIL Image, encoded image bytes) or None if generation fails
     """
     if not GEMINI_API_KEY:
         return None
     
     try:
-        import requests
-        import base64
-        from PIL import Image
-        import random
-        
         # Create a prompt for image generation
-        if image_type == "briefing":
-            prompt = f"""Create a cyberpunk anime-style poster illustration depicting: {story_text[:200]}
-            
-Style: Retro-futuristic cyberpunk aesthetic, animated character art style, neon colors (cyan, purple, green), 
-dark backgrounds, glowing effects, terminal/CRT screen aesthetic, dramatic lighting, action-oriented composition.
-The image should show animated-looking characters in a cyberpunk setting."""
-        else:  # outcome
-            prompt = f"""Create a cyberpunk anime-style poster illustration depicting the mission outcome: {story_text[:200]}
-            
-Style: Retro-futuristic cyberpunk aesthetic, animated character art style, neon colors (cyan, purple, red/green based on outcome), 
-dark backgrounds, glowing effects, terminal/CRT screen aesthetic, dramatic lighting, cinematic composition.
-The image should show animated-looking characters in a cyberpunk setting representing the mission result."""
-        
-        # Gemini image-capable model endpoints (include higher-quota preview)
-        gemini_image_models = [
-            "gemini-2.0-flash-preview-image-generation",  # recommended for higher quota
-            "gemini-2.5-flash-image",
-            "gemini-2.0-flash-exp",
-        ]
-        random.shuffle(gemini_image_models)
+        prompt = _build_prompt(story_text, image_type)
         
         headers = {
             "Content-Type": "application/json"
@@ -97,30 +276,26 @@ The image should show animated-looking characters in a cyberpunk setting represe
             }]
         }
         
-        for model_name in gemini_image_models:
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={GEMINI_API_KEY}"
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Extract image from response
-                if "candidates" in data and len(data["candidates"]) > 0:
-                    candidate = data["candidates"][0]
-                    if "content" in candidate and "parts" in candidate["content"]:
-                        for part in candidate["content"]["parts"]:
-                            if "inlineData" in part:
-                                image_data_b64 = part["inlineData"]["data"]
-                                image_data = base64.b64decode(image_data_b64)
-                                return Image.open(BytesIO(image_data))
-                            elif "data" in part:
-                                # Try direct data
-                                image_data = part["data"]
-                                if isinstance(image_data, str):
-                                    image_data = base64.b64decode(image_data)
-                                return Image.open(BytesIO(image_data))
-            else:
-                print(f"Gemini API error ({model_name}): {response.status_code} - {response.text}")
+        session = _get_session()
+        # Ask every model at once and keep the first image that comes back,
+        # so a slow or failing model no longer delays the fallbacks.
+        # Daemon threads: requests still running after a winner (or when the
+        # game quits) are simply abandoned instead of delaying exit.
+        results = queue.Queue()
+
+        def request_model(model_name):
+            result = None
+            try:
+                result = _request_gemini_image(session, model_name, headers, payload)
+            finally:
+                results.put(result)
+
+        for model_name in GEMINI_IMAGE_MODELS:
+            threading.Thread(target=request_model, args=(model_name,), daemon=True).start()
+        for _ in GEMINI_IMAGE_MODELS:
+            result = results.get()
+            if result is not None:
+                return result
         
         return None
     except Exception as e:
@@ -139,7 +314,7 @@ def _generate_with_imagen(story_text, image_type="briefing"):
         image_type: "briefing" for opening story, "outcome" for ending story
     
     Returns:
-        PIL Image object or None if generation fails
+        (PIL Image, encoded image bytes) or None if generation fails
     """
     if not PROJECT_ID:
         return None
@@ -152,18 +327,7 @@ def _generate_with_imagen(story_text, image_type="briefing"):
         aiplatform.init(project=PROJECT_ID, location=LOCATION)
         
         # Create a prompt for image generation
-        if image_type == "briefing":
-            prompt = f"""Create a cyberpunk anime-style poster illustration depicting: {story_text[:200]}
-            
-Style: Retro-futuristic cyberpunk aesthetic, animated character art style, neon colors (cyan, purple, green), 
-dark backgrounds, glowing effects, terminal/CRT screen aesthetic, dramatic lighting, action-oriented composition.
-The image should show animated-looking characters in a cyberpunk setting."""
-        else:  # outcome
-            prompt = f"""Create a cyberpunk anime-style poster illustration depicting the mission outcome: {story_text[:200]}
-            
-Style: Retro-futuristic cyberpunk aesthetic, animated character art style, neon colors (cyan, purple, red/green based on outcome), 
-dark backgrounds, glowing effects, terminal/CRT screen aesthetic, dramatic lighting, cinematic composition.
-The image should show animated-looking characters in a cyberpunk setting representing the mission result."""
+        prompt = _build_prompt(story_text, image_type)
         
         # Use Imagen 3 API (imagegeneration@006)
         model = vision_models.ImageGenerationModel.from_pretrained("imagegeneration@006")
@@ -181,9 +345,6 @@ The image should show animated-looking characters in a cyberpunk setting represe
             # Get the first generated image
             generated_image = response.images[0]
             
-            # Convert to PIL Image
-            from PIL import Image
-            
             # Imagen returns images - access the image bytes
             if hasattr(generated_image, '_image_bytes'):
                 image_bytes = generated_image._image_bytes
@@ -194,14 +355,14 @@ The image should show animated-looking characters in a cyberpunk setting represe
             else:
                 # Try accessing via gcs_uri if available
                 if hasattr(generated_image, 'gcs_uri'):
-                    import requests
                     # Download from GCS URI (would need proper auth)
                     print("Image available at GCS URI, but direct download not implemented")
                     return None
                 return None
             
             if image_bytes:
-                return Image.open(BytesIO(image_bytes))
+                # Convert to PIL Image
+                return _open_image(image_bytes), image_bytes
         
         return None
     except ImportError:
@@ -214,11 +375,48 @@ The image should show animated-looking characters in a cyberpunk setting represe
         return None
 
 
+def _get_grid_mask(width, height, spacing=40):
+    """
+    Get a mask of the 1px grid lines used behind the placeholder image.
+    
+    The mask is built by tiling a single spacing x spacing cell, so the
+    whole pattern costs a handful of pastes instead of one line call per
+    grid line. Masks are cached per size.
+    
+    Args:
+        width: Mask width in pixels
+        height: Mask height in pixels
+        spacing: Distance between grid lines in pixels
+    
+    Returns:
+        PIL Image in mode "L" (255 on grid lines, 0 elsewhere)
+    """
+    key = (width, height, spacing)
+    if key not in _grid_masks:
+        tile = Image.new('L', (spacing, spacing), 0)
+        tile_draw = ImageDraw.Draw(tile)
+        tile_draw.line([(0, 0), (0, spacing)], fill=255, width=1)
+        tile_draw.line([(0, 0), (spacing, 0)], fill=255, width=1)
+        
+        # Tile one row, then tile that row down the image
+        row = Image.new('L', (width, spacing), 0)
+        for x in range(0, width, spacing):
+            row.paste(tile, (x, 0))
+        mask = Image.new('L', (width, height), 0)
+        for y in range(0, height, spacing):
+            mask.paste(row, (0, y))
+        _grid_masks[key] = mask
+    return _grid_masks[key]
+
+
 def generate_mission_image_simple(story_text, image_type="briefing"):
     """
     Fallback: Generate a cyberpunk-themed placeholder image with character-like shapes.
     Creates a stylized poster-like image with geometric character representations.
     
+    The artwork only depends on image_type, so each variant is drawn once
+    and every call returns a copy of the cached template.
+    
     Args:
         story_text: The story text (not used in fallback)
         image_type: "briefing" or "outcome"
@@ -226,31 +424,42 @@ def generate_mission_image_simple(story_text, image_type="briefing"):
     Returns:
         PIL Image object
     """
-    from PIL import Image, ImageDraw
-    
-    # Create a placeholder image
-    width, height = 800, 400
-    img = Image.new('RGB', (width, height), color='#000000')
-    draw = ImageDraw.Draw(img)
-    
     # Draw cyberpunk-style placeholder with character-like shapes
     if image_type == "briefing":
         primary_color = (6, 182, 212)  # CYAN_500
         accent_color = (34, 211, 238)  # CYAN_400
-        text = "MISSION BRIEFING"
     else:
+        image_type = "outcome"
         primary_color = (239, 68, 68)  # RED_500
         accent_color = (248, 113, 113)  # RED_400
-        text = "MISSION OUTCOME"
+    
+    if image_type not in _placeholder_templates:
+        _placeholder_templates[image_type] = _build_placeholder(primary_color, accent_color)
+    return _placeholder_templates[image_type].copy()
+
+
+def _build_placeholder(primary_color, accent_color):
+    """
+    Draw the placeholder artwork for one color scheme.
+    
+    Args:
+        primary_color: RGB tuple for borders and body lines
+        accent_color: RGB tuple for the head, glow rings and tech dots
+    
+    Returns:
+        PIL Image object
+    """
+    # Create a placeholder image
+    width, height = 800, 400
+    img = Image.new('RGB', (width, height), color='#000000')
+    draw = ImageDraw.Draw(img)
     
     # Draw thick border
     draw.rectangle([0, 0, width-1, height-1], outline=primary_color, width=6)
     
-    # Draw grid pattern background
-    for i in range(0, width, 40):
-        draw.line([(i, 0), (i, height)], fill=(primary_color[0]//4, primary_color[1]//4, primary_color[2]//4), width=1)
-    for i in range(0, height, 40):
-        draw.line([(0, i), (width, i)], fill=(primary_color[0]//4, primary_color[1]//4, primary_color[2]//4), width=1)
+    # Draw grid pattern background (drawn over the border, like the lines it replaces)
+    grid_color = (primary_color[0]//4, primary_color[1]//4, primary_color[2]//4)
+    img.paste(grid_color, (0, 0), _get_grid_mask(width, height))
     
     # Draw character-like geometric shapes (anime-style silhouettes)
     center_x, center_y = width // 2, height // 2
@@ -22,11 +22,15 @@ Game Flow:
 8. Ending story generation (LLM)
 """
 
+import functools
+import itertools
 import pygame
 import random
 import threading
 
-from cell import Cell
+from cell import (
+    EMPTY, P_BOMB, A_BOMB, REVEALED_BY_PLAYER, ITEM_LETTERS, REVEALER_CODES
+)
 from story_generator import StoryGenerator
 from opponent_ai import OpponentAI
 from image_generator import generate_mission_image, generate_mission_image_simple
@@ -58,12 +62,48 @@ WIN_COLOR = GREEN_500
 PANEL_COLOR = (20, 20, 20)  # Very dark panel
 RED = RED_500  # For timer warnings
 
+# Byte translation table mapping revealed flag 0 -> 1 and anything else -> 0
+_HIDDEN_TABLE = bytes([1] + [0] * 255)
+
+# Difficulty selection buttons: (difficulty, label, color scheme), top to bottom
+DIFFICULTY_BUTTONS = (
+    ('easy', "EASY [5x5]", 'green'),
+    ('medium', "MEDIUM [10x10]", 'yellow'),
+    ('hard', "HARD [15x15]", 'red'),
+)
+DIFFICULTY_BUTTON_SIZE = (250, 50)
+DIFFICULTY_BUTTON_SPACING = 70
+
+# Number of rendered text surfaces kept by render_text
+TEXT_CACHE_SIZE = 512
+
+# Posted by background workers when they finish, to wake an idle main loop
+WORKER_DONE_EVENT = pygame.USEREVENT + 1
+
+# Event types the game never handles. Blocking them keeps them out of the
+# queue, so they don't wake the loop and force a redraw. MOUSEMOTION stays
+# (hover highlights) and so does TEXTINPUT (fills in KEYDOWN.unicode).
+IGNORED_EVENT_TYPES = [
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+]
+
 
 class Grid:
     """
     Manages the game grid and game state.
 
-    The grid is a 2D array of cells that can contain bombs or be empty.
+    Cell state is stored as parallel flat buffers (structure of arrays),
+    indexed by ``row * width + col``:
+    - revealed: 1 if the cell has been revealed
+    - item_kind: EMPTY, P_BOMB or A_BOMB
+    - revealed_by: REVEALED_BY_PLAYER / REVEALED_BY_AI once revealed
     Handles bomb placement, cell revelation, victory detection, and rendering.
     """
 
@@ -83,13 +123,37 @@ class Grid:
         self.width = width
         self.height = height
         self.cell_size = cell_size
-        # Create 2D array of cells
-        self.cells = [[Cell() for _ in range(height)] for _ in range(width)]
+        # Pixel position of each column/row relative to the grid origin
+        self._xpix = [col * cell_size for col in range(width)]
+        self._ypix = [row * cell_size for row in range(height)]
+        # Per-cell state, one byte per cell (see class docstring).
+        # The flat index of a cell is its grid number minus one.
+        self.revealed = bytearray(width * height)
+        self.item_kind = bytearray(width * height)
+        self.revealed_by = bytearray(width * height)
+        # Zero template used by reset() to clear the buffers in place
+        self._zeros = bytes(width * height)
+        # (col, row) of every revealed cell, so drawing skips hidden cells
+        self.revealed_cells = set()
         self.running = True
         self.player_bomb_placed = False
         self.ai_bomb_placed = False
+        # Grid numbers of the placed bombs, recorded at placement time
+        self.player_bomb_pos = None
+        self.ai_bomb_pos = None
         self.player_turn = True
         self.victor = None  # 'Player' or 'AI' when game ends
+        # Rendered bomb letters indexed by item kind, built on first draw
+        self._glyph_font = None
+        self._item_glyphs = None
+        # Static render layers (independent of game state), built on first draw
+        self._background_font = None
+        self._background = None
+        self._hover_overlay = None
+        # Background plus revealed cells, and the cells not yet painted on it
+        self._board = None
+        self._board_font = None
+        self._dirty_cells = []
 
     def place_player_bomb(self, col, row):
         """
@@ -103,9 +167,11 @@ class Grid:
             True if bomb was placed successfully, False otherwise
         """
         # Only allow placement if player hasn't placed yet and cell is empty
-        if not self.player_bomb_placed and not self.cells[col][row].item_type:
-            self.cells[col][row].add_item(('P', 'B'))  # 'P' = Player, 'B' = Bomb
+        index = row * self.width + col
+        if not self.player_bomb_placed and not self.item_kind[index]:
+            self.item_kind[index] = P_BOMB
             self.player_bomb_placed = True
+            self.player_bomb_pos = index + 1
             return True
         return False
 
@@ -115,20 +181,23 @@ class Grid:
 
         This ensures AI and Player items are NEVER in the same location because:
         1. Player places their item first
-        2. AI only chooses from cells where item_type is None/Empty
-        3. Player's cell is no longer empty, so it's excluded automatically
+        2. AI only accepts cells whose item_kind is EMPTY
+        3. Player's cell is no longer empty, so it's rejected automatically
         
         This prevents same-location collision without the AI "knowing" where player is.
+        At most one cell is occupied, so rejection sampling a random cell takes
+        about one try instead of listing every empty cell first.
         """
         if self.ai_bomb_placed:
             return
-        # Find all empty cells (excludes player's already-placed item)
-        available = [(x, y) for x in range(self.width) for y in range(self.height)
-                     if not self.cells[x][y].item_type]
-        if available:
-            col, row = random.choice(available)
-            self.cells[col][row].add_item(('A', 'B'))  # 'A' = AI, 'B' = Bomb
+        if EMPTY in self.item_kind:
+            # Draw random cells until an empty one comes up
+            index = random.randrange(len(self.item_kind))
+            while self.item_kind[index] != EMPTY:
+                index = random.randrange(len(self.item_kind))
+            self.item_kind[index] = A_BOMB
             self.ai_bomb_placed = True
+            self.ai_bomb_pos = index + 1
 
     def reveal_cell(self, col, row, revealed_by):
         """
@@ -143,35 +212,36 @@ class Grid:
             True if cell was revealed successfully, False otherwise
         """
         # Validate coordinates
-        if col < 0 or col >= self.width or row < 0 or row >= self.height:
+        if not (0 <= col < self.width and 0 <= row < self.height):
             return False
-        cell = self.cells[col][row]
+        index = row * self.width + col
         # Don't reveal already revealed cells
-        if cell.revealed:
+        if self.revealed[index]:
             return False
         
         # CRITICAL: Prevent players from revealing their own item location
         # This ensures both items stay "in play" until opponent finds them
-        if cell.item_type:
-            item_owner = cell.item_type[0]
-            if revealed_by == 'player' and item_owner == 'P':
+        item_kind = self.item_kind[index]
+        if item_kind:
+            if revealed_by == 'player' and item_kind == P_BOMB:
                 # Player trying to reveal their own item - not allowed!
                 return False
-            elif revealed_by == 'ai' and item_owner == 'A':
+            elif revealed_by == 'ai' and item_kind == A_BOMB:
                 # AI trying to reveal its own item - not allowed!
                 return False
         
-        cell.reveal(revealed_by)
+        self.revealed[index] = 1
+        self.revealed_by[index] = REVEALER_CODES[revealed_by]
+        self.revealed_cells.add((col, row))
+        self._dirty_cells.append((col, row))
         # Check if opponent's bomb was found (victory condition)
         # Player wins by finding AI's bomb ('A'), AI wins by finding Player's bomb ('P')
-        if cell.item_type:
-            item_owner = cell.item_type[0]  # 'P' for player's item, 'A' for AI's item
-            if revealed_by == 'player' and item_owner == 'A':
-                # Player found AI's item - Player wins!
-                self.victor = 'Player'
-            elif revealed_by == 'ai' and item_owner == 'P':
-                # AI found Player's item - AI wins!
-                self.victor = 'AI'
+        if revealed_by == 'player' and item_kind == A_BOMB:
+            # Player found AI's item - Player wins!
+            self.victor = 'Player'
+        elif revealed_by == 'ai' and item_kind == P_BOMB:
+            # AI found Player's item - AI wins!
+            self.victor = 'AI'
         return True
 
     def reset(self):
@@ -180,11 +250,19 @@ class Grid:
 
         Clears all cells and resets game state flags.
         """
-        self.cells = [[Cell() for _ in range(self.height)]
-                       for _ in range(self.width)]
+        # Clear the existing buffers in place rather than reallocating them
+        self.revealed[:] = self._zeros
+        self.item_kind[:] = self._zeros
+        self.revealed_by[:] = self._zeros
+        self.revealed_cells.clear()
+        # Rebuild the board from the background on next draw
+        self._board = None
+        self._dirty_cells.clear()
         self.running = True
         self.player_bomb_placed = False
         self.ai_bomb_placed = False
+        self.player_bomb_pos = None
+        self.ai_bomb_pos = None
         self.player_turn = True
         self.victor = None
 
@@ -195,8 +273,27 @@ class Grid:
         Returns:
             List of (col, row) tuples for unrevealed cells
         """
-        return [(x, y) for x in range(self.width) for y in range(self.height)
-                if not self.cells[x][y].revealed]
+        return [(index % self.width, index // self.width)
+                for index in self.get_unrevealed_indices()]
+
+    def get_unrevealed_indices(self):
+        """
+        Get flat indices (grid number - 1) of all unrevealed cells.
+
+        The scan runs in C: the revealed buffer is inverted with a byte
+        translation table, and each column's stride of it is used as a
+        selector over that column's cell indices.
+
+        Returns:
+            List of flat cell indices in column-major order (down each
+            column, left to right), the order the opponent AI is given
+        """
+        width = self.width
+        hidden = self.revealed.translate(_HIDDEN_TABLE)
+        indices = []
+        for col in range(width):
+            indices.extend(itertools.compress(range(col, len(hidden), width), hidden[col::width]))
+        return indices
 
     def ai_reveal(self, target_grid_num=None):
         """
@@ -211,14 +308,15 @@ class Grid:
         """
         # If player gave a hint, try to reveal that grid number
         if target_grid_num:
-            col, row = self.get_coords_from_number(target_grid_num)
-            if not self.cells[col][row].revealed:
+            # Grid numbers map straight onto the flat buffers
+            if not self.revealed[target_grid_num - 1]:
+                col, row = self.get_coords_from_number(target_grid_num)
                 self.reveal_cell(col, row, 'ai')
                 return True
         # Otherwise, choose randomly from unrevealed cells
-        unrevealed = self.get_unrevealed_cells()
+        unrevealed = self.get_unrevealed_indices()
         if unrevealed:
-            col, row = random.choice(unrevealed)
+            col, row = self.get_coords_from_number(random.choice(unrevealed) + 1)
             self.reveal_cell(col, row, 'ai')
             return True
         return False
@@ -244,7 +342,7 @@ class Grid:
         col = adjusted_x // self.cell_size
         row = adjusted_y // self.cell_size
         # Validate coordinates
-        if col < 0 or col >= self.width or row < 0 or row >= self.height:
+        if not (0 <= col < self.width and 0 <= row < self.height):
             return False
         if game_state == 'bomb_placement':
             success = self.place_player_bomb(col, row)
@@ -281,36 +379,161 @@ class Grid:
         Returns:
             Tuple of (col, row) coordinates (0-indexed)
         """
-        grid_num -= 1  # Convert to 0-indexed
-        row = grid_num // self.width
-        col = grid_num % self.width
+        row, col = divmod(grid_num - 1, self.width)  # Convert to 0-indexed
         return col, row
 
     def get_ai_bomb_location(self):
         """
-        Find the grid number where the AI's bomb is located.
+        Get the grid number where the AI's bomb was placed.
 
         Returns:
-            Grid number (1-indexed) or None if not found
+            Grid number (1-indexed) or None if not placed yet
         """
-        for x in range(self.width):
-            for y in range(self.height):
-                if self.cells[x][y].item_type and self.cells[x][y].item_type[0] == 'A':
-                    return self.get_grid_number(x, y)
-        return None
+        return self.ai_bomb_pos
 
     def get_player_bomb_location(self):
         """
-        Find the grid number where the player's bomb is located.
+        Get the grid number where the player's bomb was placed.
+
+        Returns:
+            Grid number (1-indexed) or None if not placed yet
+        """
+        return self.player_bomb_pos
+
+    def _get_item_glyphs(self, font):
+        """
+        Get the rendered bomb letters, rendering them only once per font.
+
+        Args:
+            font: Font for bomb letters (P/A)
+
+        Returns:
+            Tuple of surfaces indexed by item kind (None for EMPTY)
+        """
+        if self._glyph_font is not font:
+            self._glyph_font = font
+            self._item_glyphs = tuple(
+                render_text(font, letter, BLACK) if letter else None
+                for letter in ITEM_LETTERS
+            )
+        return self._item_glyphs
+
+    def _get_background(self, small_font):
+        """
+        Get the pre-rendered unrevealed board, rendering it only once per font.
+
+        Every cell starts out black with a cyan border and its grid number,
+        and only revealed cells are drawn over it, so the whole board can be
+        blitted in one call instead of issuing draw calls per cell each frame.
+
+        Args:
+            small_font: Font for grid numbers
+
+        Returns:
+            Pygame surface the size of the grid
+        """
+        if self._background_font is not small_font:
+            self._background_font = small_font
+            background = pygame.Surface((self.width * self.cell_size, self.height * self.cell_size))
+            background.fill(BLACK)
+            for x in range(self.width):
+                for y in range(self.height):
+                    rect = pygame.Rect(self._xpix[x], self._ypix[y], self.cell_size, self.cell_size)
+                    pygame.draw.rect(background, CYAN_700, rect, 4)
+                    # Grid number in top-left corner
+                    num_text = render_text(small_font, str(self.get_grid_number(x, y)), CYAN_700)
+                    background.blit(num_text, (rect.x + 4, rect.y + 4))
+            self._background = background
+        return self._background
+
+    def _get_board(self, font, small_font):
+        """
+        Get the rendered board, repainting only cells revealed since last draw.
+
+        The board starts as a copy of the static background. Each reveal
+        queues its cell in _dirty_cells, and only those cells are painted
+        onto the board here, so per-frame grid work does not grow with the
+        number of revealed cells.
+
+        Args:
+            font: Font for bomb letters (P/A)
+            small_font: Font for grid numbers
+
+        Returns:
+            Pygame surface the size of the grid
+        """
+        if (self._board is None or self._board_font is not font
+                or self._background_font is not small_font):
+            self._board = self._get_background(small_font).copy()
+            self._board_font = font
+            # Repaint everything already revealed onto the fresh board
+            self._dirty_cells = list(self.revealed_cells)
+        if self._dirty_cells:
+            item_glyphs = self._get_item_glyphs(font)
+            for x, y in self._dirty_cells:
+                self._paint_revealed_cell(self._board, x, y, item_glyphs)
+            self._dirty_cells.clear()
+        return self._board
+
+    def _paint_revealed_cell(self, target, x, y, item_glyphs):
+        """
+        Paint one revealed cell onto the board surface.
+
+        Args:
+            target: Board surface (grid-local coordinates)
+            x: Column index
+            y: Row index
+            item_glyphs: Rendered bomb letters indexed by item kind
+        """
+        index = y * self.width + x
+        item_kind = self.item_kind[index]
+        rect = pygame.Rect(self._xpix[x], self._ypix[y], self.cell_size, self.cell_size)
+
+        # Determine cell color and border
+        # Green if bomb found (winning reveal)
+        if item_kind:
+            color = GREEN_500
+            border_color = GREEN_700
+        # Blue for player reveals
+        elif self.revealed_by[index] == REVEALED_BY_PLAYER:
+            color = BLUE_500
+            border_color = BLUE_600
+        # Red for AI reveals
+        else:
+            color = RED_500
+            border_color = RED_600
+
+        # Draw filled cell
+        pygame.draw.rect(target, color, rect)
+        # Draw thick border
+        pygame.draw.rect(target, border_color, rect, 4)
+
+        # Draw bomb letter if cell contains a bomb
+        if item_kind:
+            text = item_glyphs[item_kind]
+            text_rect = text.get_rect(center=rect.center)
+            target.blit(text, text_rect)
+
+    def _get_glow_layers(self):
+        """
+        Get the translucent glow layers drawn behind the grid border.
 
         Returns:
-            Grid number (1-indexed) or None if not found
+            List of (spread, surface) pairs, widest and faintest first
         """
-        for x in range(self.width):
-            for y in range(self.height):
-                if self.cells[x][y].item_type and self.cells[x][y].item_type[0] == 'P':
-                    return self.get_grid_number(x, y)
-        return None
+        outer_width = self.width * self.cell_size + 12
+        outer_height = self.height * self.cell_size + 12
+        return [(i, get_glow_surface(outer_width + i*2, outer_height + i*2, CYAN_500, 40 * (4 - i)))
+                for i in range(3, 0, -1)]
+
+    def _get_hover_overlay(self):
+        """Get the semi-transparent cyan overlay for the hovered cell."""
+        if self._hover_overlay is None:
+            # SRCALPHA needed for per-pixel alpha
+            self._hover_overlay = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+            # RGBA: cyan-ish with low alpha for subtle highlight
+            self._hover_overlay.fill((0, 255, 255, 40))
+        return self._hover_overlay
 
     def draw(self, surface, font, small_font, x_offset=0, y_offset=0, mouse_pos=None):
         """
@@ -333,7 +556,7 @@ class Grid:
         # Compute which grid cell (if any) the mouse is over
         hover_col = (mx - x_offset) // self.cell_size
         hover_row = (my - y_offset) // self.cell_size
-        if hover_col < 0 or hover_col >= self.width or hover_row < 0 or hover_row >= self.height:
+        if not (0 <= hover_col < self.width and 0 <= hover_row < self.height):
             hover_col = hover_row = None
 
         # Draw outer glow border around entire grid
@@ -341,81 +564,27 @@ class Grid:
             x_offset - 6, y_offset - 6,
             self.width * self.cell_size + 12, self.height * self.cell_size + 12
         )
-        # Glow effect (multiple borders)
-        for i in range(3, 0, -1):
-            alpha = 40 * (4 - i)
-            glow_surf = pygame.Surface((grid_outer_rect.width + i*2, grid_outer_rect.height + i*2))
-            glow_surf.set_alpha(alpha)
-            glow_surf.fill(CYAN_500)
+        # Glow effect (multiple borders), layers built once per grid
+        for i, glow_surf in self._get_glow_layers():
             surface.blit(glow_surf, (grid_outer_rect.x - i, grid_outer_rect.y - i))
 
         # Draw thick cyan border around grid
         pygame.draw.rect(surface, CYAN_500, grid_outer_rect, 6)
 
-        for x in range(self.width):
-            for y in range(self.height):
-                cell = self.cells[x][y]
-                # Calculate cell rectangle position with offset
-                rect = pygame.Rect(
-                    x * self.cell_size + x_offset,
-                    y * self.cell_size + y_offset,
-                    self.cell_size,
-                    self.cell_size
-                )
-
-                # Is this the hovered cell?
-                is_hover = (hover_col is not None and hover_row is not None and x == hover_col and y == hover_row)
-
-                # Determine cell color and border
-                if cell.revealed:
-                    # Green if bomb found (winning reveal)
-                    if cell.item_type and cell.item_type[0] in ['P', 'A']:
-                        color = GREEN_500
-                        border_color = GREEN_700
-                    # Blue for player reveals
-                    elif cell.revealed_by == 'player':
-                        color = BLUE_500
-                        border_color = BLUE_600
-                    # Red for AI reveals
-                    else:
-                        color = RED_500
-                        border_color = RED_600
-
-                    # Draw filled cell
-                    pygame.draw.rect(surface, color, rect)
-                    # Draw thick border
-                    pygame.draw.rect(surface, border_color, rect, 4)
-
-                    # Draw bomb letter if cell contains a bomb
-                    if cell.item_type:
-                        text = font.render(cell.item_type[0], True, BLACK)
-                        text_rect = text.get_rect(center=rect.center)
-                        surface.blit(text, text_rect)
-
-                    # If hovered and already revealed, add a subtle highlight border
-                    if is_hover:
-                        pygame.draw.rect(surface, CYAN_500, rect, 2)
-
-                else:
-                    # Unrevealed cell - black with cyan border
-                    pygame.draw.rect(surface, BLACK, rect)
-                    pygame.draw.rect(surface, CYAN_700, rect, 4)
-
-                    # Draw grid number in top-left corner
-                    grid_num = self.get_grid_number(x, y)
-                    num_text = small_font.render(str(grid_num), True, CYAN_700)
-                    surface.blit(num_text, (rect.x + 4, rect.y + 4))
-
-                    # If hovered and unrevealed, draw a semi-transparent cyan overlay
-                    if is_hover:
-                        # Create a small alpha surface to overlay highlight (SRCALPHA needed for alpha)
-                        hover_surf = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
-                        # RGBA: cyan-ish with low alpha for subtle highlight
-                        hover_surf.fill((0, 255, 255, 40))  # last number is alpha (0-255)
-                        surface.blit(hover_surf, rect.topleft)
-                        # Optional: draw a slightly brighter border for hovered cell
-                        pygame.draw.rect(surface, CYAN_500, rect, 3)
+        # Whole board (background plus revealed cells) in one blit
+        surface.blit(self._get_board(font, small_font), (x_offset, y_offset))
 
+        # Highlight the hovered cell
+        if hover_col is not None:
+            rect = pygame.Rect(self._xpix[hover_col] + x_offset, self._ypix[hover_row] + y_offset,
+                               self.cell_size, self.cell_size)
+            if self.revealed[hover_row * self.width + hover_col]:
+                # Already revealed: add a subtle highlight border
+                pygame.draw.rect(surface, CYAN_500, rect, 2)
+            else:
+                # Unrevealed: semi-transparent cyan overlay plus a brighter border
+                surface.blit(self._get_hover_overlay(), rect.topleft)
+                pygame.draw.rect(surface, CYAN_500, rect, 3)
 
 
 def check_button_click(x, y, button_rect):
@@ -430,8 +599,9 @@ def check_button_click(x, y, button_rect):
     Returns:
         True if point is within button, False otherwise
     """
-    return (button_rect[0] <= x <= button_rect[0] + button_rect[2] and
-            button_rect[1] <= y <= button_rect[1] + button_rect[3])
+    # Offset-based chained compares: one subtraction per axis, edges inclusive
+    return (0 <= x - button_rect[0] <= button_rect[2] and
+            0 <= y - button_rect[1] <= button_rect[3])
 
 
 def get_difficulty_size(difficulty):
@@ -492,6 +662,67 @@ def get_difficulty_attempts(difficulty):
     return 5  # Default to easy
 
 
+def get_difficulty_button_rects(width, height):
+    """
+    Get the difficulty selection button rectangles for a window size.
+
+    Args:
+        width: Window width in pixels
+        height: Window height in pixels
+
+    Returns:
+        List of (difficulty, rect) pairs in DIFFICULTY_BUTTONS order
+    """
+    button_width, button_height = DIFFICULTY_BUTTON_SIZE
+    start_y = height // 2 - 100
+    button_x = (width - button_width) // 2
+    return [(difficulty, (button_x, start_y + i * DIFFICULTY_BUTTON_SPACING, button_width, button_height))
+            for i, (difficulty, _, _) in enumerate(DIFFICULTY_BUTTONS)]
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(font, text, color):
+    """
+    Render a piece of text, reusing the surface while it stays in the cache.
+
+    Meant for text that repeats across frames (labels, chat lines, timer
+    values); least recently used surfaces are dropped once the cache is full.
+
+    Args:
+        font: Pygame font
+        text: Text to render
+        color: Text color (tuple)
+
+    Returns:
+        Rendered (antialiased) pygame Surface, shared between callers
+    """
+    text_surf = font.render(text, True, color)
+    # Match the display's pixel format once so later blits need no conversion
+    if pygame.display.get_surface() is not None:
+        text_surf = text_surf.convert_alpha()
+    return text_surf
+
+
+@functools.lru_cache(maxsize=32)
+def get_glow_surface(width, height, color, alpha):
+    """
+    Get a solid translucent glow layer, creating it only once per size.
+
+    Args:
+        width: Layer width in pixels
+        height: Layer height in pixels
+        color: Fill color
+        alpha: Surface alpha (0-255)
+
+    Returns:
+        Pygame surface shared between callers (blit only, do not draw on it)
+    """
+    glow_surf = pygame.Surface((width, height))
+    glow_surf.set_alpha(alpha)
+    glow_surf.fill(color)
+    return glow_surf
+
+
 def draw_cyberpunk_button(surface, rect, text, font, is_hovered=False, color_scheme='cyan'):
     """
     Draw a button with cyberpunk CRT styling (thick borders, neon glow).
@@ -527,9 +758,8 @@ def draw_cyberpunk_button(surface, rect, text, font, is_hovered=False, color_sch
     # Draw glow effect on hover
     if is_hovered:
         for i in range(2, 0, -1):
-            glow_surf = pygame.Surface((button_rect.width + i*4, button_rect.height + i*4))
-            glow_surf.set_alpha(60 * (3 - i))
-            glow_surf.fill(glow_color)
+            glow_surf = get_glow_surface(button_rect.width + i*4, button_rect.height + i*4,
+                                         glow_color, 60 * (3 - i))
             surface.blit(glow_surf, (button_rect.x - i*2, button_rect.y - i*2))
     
     # Draw button background (black)
@@ -538,27 +768,83 @@ def draw_cyberpunk_button(surface, rect, text, font, is_hovered=False, color_sch
     pygame.draw.rect(surface, border_color, button_rect, 6)
     
     # Draw text (centered)
-    text_surf = font.render(text, True, text_color)
+    text_surf = render_text(font, text, text_color)
     text_rect = text_surf.get_rect(center=button_rect.center)
     surface.blit(text_surf, text_rect)
 
 
-def draw_scanlines(surface, opacity=20):
+def resize_window(window, width, height):
     """
-    Draw horizontal scanlines for CRT effect.
-    
+    Resize the game window, skipping set_mode when the size already matches.
+
+    set_mode recreates the window and its display surface, so calling it
+    for an unchanged size just causes a visible hitch.
+
     Args:
-        surface: Pygame surface to draw on
+        window: Current display surface
+        width: Requested window width
+        height: Requested window height
+
+    Returns:
+        Display surface of the requested size
+    """
+    if window.get_size() == (width, height):
+        return window
+    return pygame.display.set_mode((width, height), pygame.RESIZABLE)
+
+
+@functools.lru_cache(maxsize=4)
+def get_scanline_overlay(width, height, opacity):
+    """
+    Get the scanline overlay for a window size, drawing it only once.
+
+    Args:
+        width: Overlay width in pixels
+        height: Overlay height in pixels
         opacity: Alpha transparency (0-255)
+
+    Returns:
+        Pygame surface with per-pixel alpha, shared between callers
     """
-    width, height = surface.get_size()
     scanline_surf = pygame.Surface((width, height), pygame.SRCALPHA)
     
     # Draw horizontal lines every 4 pixels
     for y in range(0, height, 4):
         pygame.draw.line(scanline_surf, (*CYAN_500, opacity), (0, y), (width, y), 1)
+    return scanline_surf.convert_alpha()
+
+
+def start_worker(target):
+    """
+    Run a function on a daemon thread and post WORKER_DONE_EVENT when it returns.
+
+    The event wakes the main loop while it waits idle for input, so story,
+    image and chat results show up without the loop having to poll.
+
+    Args:
+        target: Function to run (no arguments)
+    """
+    def run():
+        try:
+            target()
+        finally:
+            try:
+                pygame.event.post(pygame.event.Event(WORKER_DONE_EVENT))
+            except pygame.error:
+                pass  # Game already quit while the worker was running
+    threading.Thread(target=run, daemon=True).start()
+
+
+def draw_scanlines(surface, opacity=20):
+    """
+    Draw horizontal scanlines for CRT effect.
     
-    surface.blit(scanline_surf, (0, 0))
+    Args:
+        surface: Pygame surface to draw on
+        opacity: Alpha transparency (0-255)
+    """
+    width, height = surface.get_size()
+    surface.blit(get_scanline_overlay(width, height, opacity), (0, 0))
 
 
 def ai_honesty_check():
@@ -571,33 +857,68 @@ def ai_honesty_check():
     Returns:
         True if AI is honest (50% chance), False if AI lies
     """
-    return random.randint(1, 2) == 1
+    return random.getrandbits(1) == 1  # Single random bit, no float math
+
+
+@functools.lru_cache(maxsize=4096)
+def text_width(font, text):
+    """
+    Get the rendered pixel width of a piece of text, memoized.
+
+    Args:
+        font: Pygame font object
+        text: Text to measure
+
+    Returns:
+        Width in pixels
+    """
+    return font.size(text)[0]
 
 
+@functools.lru_cache(maxsize=256)
 def wrap_text(text, font, max_width):
     """
     Wrap text to fit within a specified width.
 
+    Line widths are estimated by adding up word and space widths, each
+    measured once (and remembered across calls by text_width). Rounding
+    can throw the estimate off slightly, so a margin of 2 pixels per word
+    is allowed and the exact joined line is only measured when the
+    estimate falls within that margin of max_width. Results are memoized,
+    so chat history and finished stories are not re-wrapped every frame.
+
     Args:
         text: Text to wrap
         font: Pygame font object
         max_width: Maximum width in pixels
 
     Returns:
-        List of text lines that fit within max_width
+        List of text lines that fit within max_width (shared, do not modify)
     """
     words = text.split(' ')
     lines = []
     current_line = []
+    line_width = 0
+    space_width = text_width(font, ' ')
 
     for word in words:
-        test_line = ' '.join(current_line + [word])
-        if font.size(test_line)[0] <= max_width:
+        word_width = text_width(font, word)
+        test_width = line_width + space_width + word_width if current_line else word_width
+        margin = 2 * (len(current_line) + 1)  # Rounding slack for the estimate
+        if test_width <= max_width - margin:
+            fits = True
+        elif test_width > max_width + margin:
+            fits = False
+        else:
+            fits = font.size(' '.join(current_line + [word]))[0] <= max_width
+        if fits:
             current_line.append(word)
+            line_width = test_width
         else:
             if current_line:
                 lines.append(' '.join(current_line))
             current_line = [word]
+            line_width = word_width
 
     if current_line:
         lines.append(' '.join(current_line))
@@ -605,6 +926,41 @@ def wrap_text(text, font, max_width):
     return lines
 
 
+def draw_story_lines(surface, lines, font, x, y, streaming, line_height=30):
+    """
+    Draw wrapped story lines, one per row.
+
+    Lines above the last one no longer change, so they come from the text
+    cache. While the story is still streaming the last line grows every
+    frame, so it is rendered directly instead of filling the cache.
+
+    Args:
+        surface: Pygame surface to draw on
+        lines: Wrapped lines of story text
+        font: Pygame font for the story text
+        x: Left edge of the text
+        y: Top of the first line
+        streaming: Whether the last line is still being streamed in
+        line_height: Vertical distance between lines
+
+    Returns:
+        Tuple of (y below the last line, pixel width of the last line)
+    """
+    last_width = 0
+    blit_list = []
+    for i, line in enumerate(lines):
+        if streaming and i == len(lines) - 1:
+            line_surface = font.render(line, True, WHITE)
+        else:
+            line_surface = render_text(font, line, WHITE)
+        blit_list.append((line_surface, (x, y)))
+        last_width = line_surface.get_width()
+        y += line_height
+    # One C-level call for all lines instead of a Python-level blit per line
+    surface.blits(blit_list, doreturn=False)
+    return y, last_width
+
+
 def draw_chat_sidebar(surface, x, y, width, height, opponent_ai, chat_input, chat_input_active,
                       ai_response_loading, font, small_font):
     """
@@ -628,15 +984,13 @@ def draw_chat_sidebar(surface, x, y, width, height, opponent_ai, chat_input, cha
     pygame.draw.rect(surface, BLACK, panel_rect)
     # Glow effect
     for i in range(2, 0, -1):
-        glow_surf = pygame.Surface((width + i*2, height + i*2))
-        glow_surf.set_alpha(40 * (3 - i))
-        glow_surf.fill(CYAN_500)
+        glow_surf = get_glow_surface(width + i*2, height + i*2, CYAN_500, 40 * (3 - i))
         surface.blit(glow_surf, (x - i, y - i))
     pygame.draw.rect(surface, CYAN_600, panel_rect, 6)
     
     # Title (without message count)
     title_text = ">> AI_OPPONENT_CHAT"
-    title = font.render(title_text, True, CYAN_300)
+    title = render_text(font, title_text, CYAN_300)
     surface.blit(title, (x + 10, y + 10))
     
     # Calculate input box height dynamically based on text wrapping
@@ -705,18 +1059,18 @@ def draw_chat_sidebar(surface, x, y, width, height, opponent_ai, chat_input, cha
                                      chat_area_width - 10, line_height)
                 pygame.draw.rect(surface, bg_color, bg_rect)
             
-            text_surf = small_font.render(line, True, color)
+            text_surf = render_text(small_font, line, color)
             # Clip text if it's still too long
             if text_surf.get_width() > available_width:
                 # Truncate with ellipsis
                 truncated = line[:int(len(line) * available_width / text_surf.get_width()) - 3] + "..."
-                text_surf = small_font.render(truncated, True, color)
+                text_surf = render_text(small_font, truncated, color)
             surface.blit(text_surf, (chat_area_x + text_margin, y_offset))
         y_offset += line_height
     
     # Loading indicator
     if ai_response_loading:
-        loading_text = small_font.render(">> AI_PROCESSING...", True, CYAN_400)
+        loading_text = render_text(small_font, ">> AI_PROCESSING...", CYAN_400)
         surface.blit(loading_text, (chat_area_x + text_margin, y_offset))
     
     # Input box (cyberpunk styling) - dynamically sized
@@ -730,16 +1084,15 @@ def draw_chat_sidebar(surface, x, y, width, height, opponent_ai, chat_input, cha
         # Display all wrapped lines
         line_height = 20
         text_start_y = input_y + 8
-        for i, line in enumerate(wrapped_input_lines):
-            input_surf = small_font.render(line, True, CYAN_300)
-            surface.blit(input_surf, (x + 10, text_start_y + i * line_height))
+        surface.blits([(render_text(small_font, line, CYAN_300), (x + 10, text_start_y + i * line_height))
+                       for i, line in enumerate(wrapped_input_lines)], doreturn=False)
         
         # Show blinking cursor at the end of the last line
         if chat_input_active:
-            cursor_surf = small_font.render("_", True, CYAN_400)
+            cursor_surf = render_text(small_font, "_", CYAN_400)
             if wrapped_input_lines:
                 last_line = wrapped_input_lines[-1]
-                last_line_surf = small_font.render(last_line, True, CYAN_300)
+                last_line_surf = render_text(small_font, last_line, CYAN_300)
                 cursor_x = x + 10 + last_line_surf.get_width()
             else:
                 cursor_x = x + 10
@@ -747,7 +1100,7 @@ def draw_chat_sidebar(surface, x, y, width, height, opponent_ai, chat_input, cha
             if (pygame.time.get_ticks() // 500) % 2 == 0:
                 surface.blit(cursor_surf, (cursor_x, text_start_y + (len(wrapped_input_lines) - 1) * line_height))
     else:
-        placeholder_surf = small_font.render(">> TYPE_MESSAGE...", True, CYAN_700)
+        placeholder_surf = render_text(small_font, ">> TYPE_MESSAGE...", CYAN_700)
         surface.blit(placeholder_surf, (x + 10, input_y + 8))
 
 
@@ -766,12 +1119,24 @@ def run_game():
     """
     # Initialize pygame
     pygame.init()
+    pygame.event.set_blocked(IGNORED_EVENT_TYPES)
     # Game constants
     CELL_SIZE = 40  # Pixel size of each grid cell
     CHAT_PANEL_WIDTH = 400  # Width of chat sidebar on the right
     GRID_TOP_MARGIN = 100  # Space above grid for timer and prompts
     STORY_WIDTH = 900  # Width for story display (increased for better text visibility)
     STORY_HEIGHT = 700  # Height for story display (increased for better text visibility)
+    AI_TURN_DELAY_MS = 500  # Pause before the AI moves, so the player's reveal is seen first
+    RESIZE_SETTLE_MS = 100  # Wait for a window drag to settle before calling set_mode
+    FPS = 60  # Frame rate cap during gameplay
+    # Lower caps for screens that animate slowly or not at all
+    FPS_BY_STATE = {
+        'loading_story': 15,  # Static text while waiting on the story thread
+        'loading_ending': 15,
+        'story_opening': 30,  # Text streams at 30 chars/sec
+        'story_ending': 30,
+        'difficulty_selection': 30,  # Only hover highlights change
+    }
     # Font setup
     font = pygame.font.SysFont(None, 24)  # Standard font for text
     prompt_font = pygame.font.SysFont(None, 32)  # Larger font for prompts
@@ -786,8 +1151,8 @@ def run_game():
     # Track current window dimensions
     current_width = INITIAL_WIDTH
     current_height = INITIAL_HEIGHT
-    # Initialize story generator and opponent AI
-    story_gen = StoryGenerator()
+    # Initialize opponent AI (the story generator is created by the loader thread)
+    story_gen = None
     opponent_ai = OpponentAI()
     # Game state variables
     game_state = 'loading_story'
@@ -796,6 +1161,9 @@ def run_game():
     GRID_WIDTH = 0
     GRID_HEIGHT = 0
     ai_turn_pending = False  # Flag for AI turn delay
+    ai_turn_at = 0  # Tick count (ms) at which the pending AI turn may run
+    resize_pending = False  # Window was resized by the user and set_mode is still due
+    resize_at = 0  # Tick count (ms) after which the pending resize is applied
     ai_personality = None  # 'honest', 'deceptive', or '50-50'
     # Timer variables
     timer_start = None  # Time when gameplay started
@@ -807,6 +1175,9 @@ def run_game():
     opening_story = None
     ending_story = None
     mission_data = None  # Dict with player_item and ai_item
+    # Prompts shown above the grid, built once per mission
+    hide_prompt = find_prompt = ""
+    AI_TURN_PROMPT = ">> AI'S TURN..."
     story_loading = False
     story_error = None
     story_stream_pos = 0  # Current character position for streaming effect
@@ -825,6 +1196,10 @@ def run_game():
     begin_button_rect = None  # Tracks mission briefing button rect
     clock = pygame.time.Clock()
     running = True
+    # Redraw tracking: frames are only rendered when something visible changed
+    needs_redraw = True  # Set by input events and game logic
+    last_frame_key = None  # get_frame_key() of the last rendered frame
+    pending_events = []  # Event that woke the idle wait, handled ahead of the queue
 
     # Helper function to convert PIL Image to Pygame surface
     def pil_to_surface(pil_image, max_width=800, max_height=400):
@@ -860,14 +1235,36 @@ def run_game():
         }
         return fallback_story, fallback_mission
 
+    def get_ending_story(player_won):
+        """
+        Generate the ending story for the finished mission.
+
+        The story generator is created here if the opening loader could not
+        create it, and a default ending is used if it still can't be, so the
+        ending screen always offers a new mission.
+        """
+        nonlocal story_gen
+        if story_gen is None:
+            try:
+                story_gen = StoryGenerator()
+            except Exception as story_exc:
+                print(f"Error creating story generator: {story_exc}")
+                if player_won:
+                    return "Signal lost from Gemini relay. Logged offline: you traced the AI's artifact first. Mission complete."
+                return "Signal lost from Gemini relay. Logged offline: the AI found your beacon first. Mission failed."
+        return story_gen.generate_ending_story(opening_story, player_won)
+
     # Start loading opening story in background thread
     def load_opening_story():
         nonlocal opening_story, mission_data, story_loading, story_error, game_state
-        nonlocal opening_image, opening_image_surface, image_loading
+        nonlocal opening_image, opening_image_surface, image_loading, story_gen
         story_loading = True
         fallback_used = False
         try:
             try:
+                # Client setup can be slow, so keep it off the main thread
+                if story_gen is None:
+                    story_gen = StoryGenerator()
                 opening_story, mission_data = story_gen.generate_opening_story()
             except Exception as story_exc:
                 print(f"Error generating opening story: {story_exc}")
@@ -897,20 +1294,55 @@ def run_game():
                 story_error = None
         story_loading = False
 
-    threading.Thread(target=load_opening_story, daemon=True).start()
+    def get_frame_key():
+        """
+        Summarize the time- and thread-driven inputs of the next frame.
+
+        Input events always trigger a redraw; otherwise a frame is only
+        rendered when this key differs from the last rendered frame's key.
+        """
+        ticks = pygame.time.get_ticks()
+        key = (game_state, story_error, opening_image_surface, ending_image_surface,
+               image_loading, ai_response_loading, len(opponent_ai.chat_history))
+        if game_state == 'story_opening' and opening_story:
+            # Streaming text, blinking cursor, or pulsing image placeholder
+            if (story_stream_start_time is None or story_stream_pos < len(opening_story)
+                    or opening_image_surface is None):
+                return key + (ticks,)
+        elif game_state == 'story_ending' and ending_story:
+            # Streaming text and blinking cursor
+            if story_stream_start_time is None or story_stream_pos < len(ending_story):
+                return key + (ticks,)
+        elif game_state == 'player_turn' and timer_start is not None:
+            # Timer shows whole remaining seconds
+            key += (int(max(0, timer_duration - (ticks / 1000 - timer_start))),)
+        if chat_input_active and chat_input:
+            # Blinking chat input cursor
+            key += ((ticks // 500) % 2,)
+        return key
+
+    start_worker(load_opening_story)
     # Main game loop
     while running:
         # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        events = pending_events + pygame.event.get()
+        pending_events = []
+        for event in events:
+            # Any input can change what is shown (hover, typing, clicks)
+            needs_redraw = True
+            event_type = event.type
+            if event_type == pygame.QUIT:
                 running = False
             # Handle window resize
-            if event.type == pygame.VIDEORESIZE:
+            elif event_type == pygame.VIDEORESIZE:
+                # Lay out for the new size right away, but only call set_mode once
+                # the drag has settled instead of on every resize event
                 current_width = event.w
                 current_height = event.h
-                window = pygame.display.set_mode((current_width, current_height), pygame.RESIZABLE)
-            # Handle keyboard input for chat
-            if event.type == pygame.KEYDOWN:
+                resize_pending = True
+                resize_at = pygame.time.get_ticks() + RESIZE_SETTLE_MS
+            # Handle keyboard input for chat (ignored unless the chat box is active)
+            elif event_type == pygame.KEYDOWN:
                 if chat_input_active and game_state in ['bomb_placement', 'player_turn']:
                     if event.key == pygame.K_RETURN and chat_input.strip() and not ai_response_loading:
                         # Submit chat message to opponent AI (only if not already loading)
@@ -931,7 +1363,7 @@ def run_game():
                                 ))
                             finally:
                                 ai_response_loading = False
-                        threading.Thread(target=get_ai_response, daemon=True).start()
+                        start_worker(get_ai_response)
                     elif event.key == pygame.K_BACKSPACE:
                         chat_input = chat_input[:-1]
                     elif event.key == pygame.K_ESCAPE:
@@ -941,7 +1373,7 @@ def run_game():
                         # Increased limit and only allow printable characters
                         chat_input += event.unicode
             # Handle mouse clicks
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            elif event_type == pygame.MOUSEBUTTONDOWN:
                 x, y = pygame.mouse.get_pos()
                 # Story opening screen - begin mission button
                 if game_state == 'story_opening':
@@ -952,56 +1384,13 @@ def run_game():
                 # Difficulty selection screen
                 elif game_state == 'difficulty_selection':
                     # Use same button positions as rendering (centered)
-                    button_width, button_height = 250, 50
-                    start_y = current_height // 2 - 100
-                    button_x = (current_width - button_width) // 2
-                    easy_rect = (button_x, start_y, button_width, button_height)
-                    medium_rect = (button_x, start_y + 70, button_width, button_height)
-                    hard_rect = (button_x, start_y + 140, button_width, button_height)
-                    if check_button_click(x, y, easy_rect):
-                        difficulty = 'easy'
-                        GRID_WIDTH = GRID_HEIGHT = get_difficulty_size(difficulty)
-                        timer_duration = get_difficulty_timer(difficulty)
-                        max_attempts = get_difficulty_attempts(difficulty)
-                        attempts_used = 0
-                        # Calculate window size with proper margins (at least story screen size)
-                        WINDOW_WIDTH = max(STORY_WIDTH, GRID_WIDTH * CELL_SIZE + CHAT_PANEL_WIDTH + 60)
-                        WINDOW_HEIGHT = max(STORY_HEIGHT, GRID_HEIGHT * CELL_SIZE + GRID_TOP_MARGIN + 80)
-                        window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
-                        current_width = WINDOW_WIDTH
-                        current_height = WINDOW_HEIGHT
-                        grid = Grid(GRID_WIDTH, GRID_HEIGHT, CELL_SIZE)
-                        # Initialize opponent AI with random personality
-                        ai_personality = random.choice(['honest', 'deceptive', '50-50'])
-                        opponent_ai.initialize(
-                            opening_story, mission_data, ai_personality, GRID_WIDTH * GRID_HEIGHT
-                        )
-                        game_state = 'bomb_placement'
-                        chat_input = ""
-                        chat_input_active = False
-                    elif check_button_click(x, y, medium_rect):
-                        difficulty = 'medium'
-                        GRID_WIDTH = GRID_HEIGHT = get_difficulty_size(difficulty)
-                        timer_duration = get_difficulty_timer(difficulty)
-                        max_attempts = get_difficulty_attempts(difficulty)
-                        attempts_used = 0
-                        # Calculate window size with proper margins (at least story screen size)
-                        WINDOW_WIDTH = max(STORY_WIDTH, GRID_WIDTH * CELL_SIZE + CHAT_PANEL_WIDTH + 60)
-                        WINDOW_HEIGHT = max(STORY_HEIGHT, GRID_HEIGHT * CELL_SIZE + GRID_TOP_MARGIN + 80)
-                        window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
-                        current_width = WINDOW_WIDTH
-                        current_height = WINDOW_HEIGHT
-                        grid = Grid(GRID_WIDTH, GRID_HEIGHT, CELL_SIZE)
-                        # Initialize opponent AI with random personality
-                        ai_personality = random.choice(['honest', 'deceptive', '50-50'])
-                        opponent_ai.initialize(
-                            opening_story, mission_data, ai_personality, GRID_WIDTH * GRID_HEIGHT
-                        )
-                        game_state = 'bomb_placement'
-                        chat_input = ""
-                        chat_input_active = False
-                    elif check_button_click(x, y, hard_rect):
-                        difficulty = 'hard'
+                    clicked = None
+                    for button_difficulty, rect in get_difficulty_button_rects(current_width, current_height):
+                        if check_button_click(x, y, rect):
+                            clicked = button_difficulty
+                            break
+                    if clicked:
+                        difficulty = clicked
                         GRID_WIDTH = GRID_HEIGHT = get_difficulty_size(difficulty)
                         timer_duration = get_difficulty_timer(difficulty)
                         max_attempts = get_difficulty_attempts(difficulty)
@@ -1009,10 +1398,14 @@ def run_game():
                         # Calculate window size with proper margins (at least story screen size)
                         WINDOW_WIDTH = max(STORY_WIDTH, GRID_WIDTH * CELL_SIZE + CHAT_PANEL_WIDTH + 60)
                         WINDOW_HEIGHT = max(STORY_HEIGHT, GRID_HEIGHT * CELL_SIZE + GRID_TOP_MARGIN + 80)
-                        window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
+                        window = resize_window(window, WINDOW_WIDTH, WINDOW_HEIGHT)
                         current_width = WINDOW_WIDTH
                         current_height = WINDOW_HEIGHT
                         grid = Grid(GRID_WIDTH, GRID_HEIGHT, CELL_SIZE)
+                        player_item = mission_data['player_item'] if mission_data else "bomb"
+                        ai_item = mission_data['ai_item'] if mission_data else "target"
+                        hide_prompt = f">> HIDE YOUR {player_item.upper()}"
+                        find_prompt = f">> FIND THE {ai_item.upper()}"
                         # Initialize opponent AI with random personality
                         ai_personality = random.choice(['honest', 'deceptive', '50-50'])
                         opponent_ai.initialize(
@@ -1043,14 +1436,14 @@ def run_game():
                             ending_image = None
                             opening_image_surface = None
                             ending_image_surface = None
-                            window = pygame.display.set_mode((STORY_WIDTH, STORY_HEIGHT), pygame.RESIZABLE)
+                            window = resize_window(window, STORY_WIDTH, STORY_HEIGHT)
                             current_width = STORY_WIDTH
                             current_height = STORY_HEIGHT
                             ai_turn_pending = False
                             chat_input = ""
                             chat_input_active = False
                             # Load new opening story
-                            threading.Thread(target=load_opening_story, daemon=True).start()
+                            start_worker(load_opening_story)
                         elif check_button_click(x, y, quit_rect):
                             running = False
                 # Grid clicks and chat input clicks during gameplay
@@ -1093,7 +1486,7 @@ def run_game():
                                     game_state = 'loading_ending'
                                     story_stream_pos = 0  # Reset streaming for ending story
                                     story_stream_start_time = None
-                                    window = pygame.display.set_mode((STORY_WIDTH, STORY_HEIGHT), pygame.RESIZABLE)
+                                    window = resize_window(window, STORY_WIDTH, STORY_HEIGHT)
                                     current_width = STORY_WIDTH
                                     current_height = STORY_HEIGHT
 
@@ -1102,9 +1495,7 @@ def run_game():
                                         nonlocal ending_image, ending_image_surface, image_loading
                                         try:
                                             player_won = (grid.victor == 'Player')
-                                            ending_story = story_gen.generate_ending_story(
-                                                opening_story, player_won
-                                            )
+                                            ending_story = get_ending_story(player_won)
                                             # Generate image for ending story
                                             image_loading = True
                                             try:
@@ -1126,14 +1517,14 @@ def run_game():
                                             story_loading = False
                                             game_state = 'story_ending'
 
-                                    threading.Thread(target=load_ending_story, daemon=True).start()
+                                    start_worker(load_ending_story)
                                 elif attempts_used >= max_attempts:
                                     # Out of attempts! Player loses
                                     grid.victor = 'AI'
                                     game_state = 'loading_ending'
                                     story_stream_pos = 0  # Reset streaming for ending story
                                     story_stream_start_time = None
-                                    window = pygame.display.set_mode((STORY_WIDTH, STORY_HEIGHT), pygame.RESIZABLE)
+                                    window = resize_window(window, STORY_WIDTH, STORY_HEIGHT)
                                     current_width = STORY_WIDTH
                                     current_height = STORY_HEIGHT
 
@@ -1142,9 +1533,7 @@ def run_game():
                                         nonlocal ending_image, ending_image_surface, image_loading
                                         story_loading = True
                                         try:
-                                            ending_story = story_gen.generate_ending_story(
-                                                opening_story, False
-                                            )
+                                            ending_story = get_ending_story(False)
                                             # Generate image for ending story
                                             image_loading = True
                                             try:
@@ -1166,15 +1555,22 @@ def run_game():
                                             story_loading = False
                                             game_state = 'story_ending'
 
-                                    threading.Thread(target=load_ending_story, daemon=True).start()
+                                    start_worker(load_ending_story)
                                 else:
-                                    # Game continues - trigger AI turn
+                                    # Game continues - schedule AI turn (without blocking the loop)
                                     ai_turn_pending = True
+                                    ai_turn_at = pygame.time.get_ticks() + AI_TURN_DELAY_MS
                     else:
                         # Click outside grid and chat deactivates chat input
                         if not (temp_chat_width > 0 and check_button_click(x, y, chat_input_rect)):
                             chat_input_active = False
         
+        # Apply a settled window resize (a state change may have resized it since)
+        if resize_pending and pygame.time.get_ticks() >= resize_at:
+            window = resize_window(window, current_width, current_height)
+            resize_pending = False
+            needs_redraw = True
+
         # Timer check - if time runs out, player loses
         if game_state == 'player_turn' and timer_start is not None:
             current_time = pygame.time.get_ticks() / 1000
@@ -1185,7 +1581,7 @@ def run_game():
                 game_state = 'loading_ending'
                 story_stream_pos = 0  # Reset streaming for ending story
                 story_stream_start_time = None
-                window = pygame.display.set_mode((STORY_WIDTH, STORY_HEIGHT), pygame.RESIZABLE)
+                window = resize_window(window, STORY_WIDTH, STORY_HEIGHT)
                 current_width = STORY_WIDTH
                 current_height = STORY_HEIGHT
                 
@@ -1194,7 +1590,7 @@ def run_game():
                     nonlocal ending_image, ending_image_surface, image_loading
                     story_loading = True
                     try:
-                        ending_story = story_gen.generate_ending_story(opening_story, False)
+                        ending_story = get_ending_story(False)
                         # Generate image for ending story
                         image_loading = True
                         try:
@@ -1216,18 +1612,16 @@ def run_game():
                         story_loading = False
                         game_state = 'story_ending'
                 
-                threading.Thread(target=load_ending_story, daemon=True).start()
+                start_worker(load_ending_story)
         
         # AI turn processing (with delay for better UX)
-        if grid and ai_turn_pending and game_state == 'player_turn' and not grid.player_turn:
-            pygame.time.wait(500)  # Brief delay before AI move
+        if (grid and ai_turn_pending and game_state == 'player_turn' and not grid.player_turn
+                and pygame.time.get_ticks() >= ai_turn_at):
             # Get unrevealed grids and let AI decide
-            unrevealed = grid.get_unrevealed_cells()
-            unrevealed_nums = [grid.get_grid_number(col, row) for col, row in unrevealed]
             # CRITICAL: Filter out AI's own item location from targets
             ai_item_location = grid.get_ai_bomb_location()
-            if ai_item_location in unrevealed_nums:
-                unrevealed_nums.remove(ai_item_location)
+            unrevealed_nums = [index + 1 for index in grid.get_unrevealed_indices()
+                               if index + 1 != ai_item_location]
             # Let opponent AI decide strategically (from valid targets only)
             if unrevealed_nums:
                 target_grid = opponent_ai.decide_next_move(unrevealed_nums)
@@ -1241,7 +1635,7 @@ def run_game():
                 game_state = 'loading_ending'
                 story_stream_pos = 0  # Reset streaming for ending story
                 story_stream_start_time = None
-                window = pygame.display.set_mode((STORY_WIDTH, STORY_HEIGHT), pygame.RESIZABLE)
+                window = resize_window(window, STORY_WIDTH, STORY_HEIGHT)
                 current_width = STORY_WIDTH
                 current_height = STORY_HEIGHT
 
@@ -1251,9 +1645,7 @@ def run_game():
                     story_loading = True
                     try:
                         player_won = grid.victor == 'Player'
-                        ending_story = story_gen.generate_ending_story(
-                            opening_story, player_won
-                        )
+                        ending_story = get_ending_story(player_won)
                         # Generate image for ending story
                         image_loading = True
                         try:
@@ -1274,10 +1666,23 @@ def run_game():
                         game_state = 'story_ending'
                     story_loading = False
 
-                threading.Thread(target=load_ending_story, daemon=True).start()
+                start_worker(load_ending_story)
             else:
                 grid.player_turn = True  # Switch back to player
             ai_turn_pending = False
+            needs_redraw = True  # Show the AI's reveal
+
+        # Skip rendering when nothing visible changed since the last frame
+        frame_key = get_frame_key()
+        if not needs_redraw and frame_key == last_frame_key:
+            # Sleep until the next frame is due, waking early for input or a finished worker
+            event = pygame.event.wait(1000 // FPS_BY_STATE.get(game_state, FPS))
+            if event.type != pygame.NOEVENT:
+                pending_events = [event]  # Handled first on the next pass, keeping input order
+            continue
+        needs_redraw = False
+        last_frame_key = frame_key
+
         # Reset transient UI references
         begin_button_rect = None
 
@@ -1288,18 +1693,18 @@ def run_game():
         # Render current game state (use current_width and current_height for dynamic sizing)
         if game_state == 'loading_story':
             # Show loading screen while generating opening story
-            loading_text = prompt_font.render(">> GENERATING_MISSION...", True, CYAN_400)
+            loading_text = render_text(prompt_font, ">> GENERATING_MISSION...", CYAN_400)
             text_rect = loading_text.get_rect(center=(current_width // 2, current_height // 2 - 20))
             window.blit(loading_text, text_rect)
-            spinner_text = story_font.render(">> INITIALIZING_QUANTUM_PARAMETERS...", True, CYAN_700)
+            spinner_text = render_text(story_font, ">> INITIALIZING_QUANTUM_PARAMETERS...", CYAN_700)
             text_rect2 = spinner_text.get_rect(center=(current_width // 2, current_height // 2 + 20))
             window.blit(spinner_text, text_rect2)
         elif game_state == 'story_opening':
             # Display opening story with streaming effect
             if story_error:
-                error_text = prompt_font.render(">> ERROR", True, RED_500)
+                error_text = render_text(prompt_font, ">> ERROR", RED_500)
                 window.blit(error_text, (50, 50))
-                error_msg = story_font.render(f"{story_error}", True, RED_500)
+                error_msg = render_text(story_font, str(story_error), RED_500)
                 window.blit(error_msg, (50, 100))
             elif opening_story:
                 # Initialize streaming when story first appears
@@ -1312,7 +1717,7 @@ def run_game():
                 elapsed_ms = pygame.time.get_ticks() - story_stream_start_time
                 story_stream_pos = min(len(opening_story), int(chars_per_second * elapsed_ms / 1000))
                 
-                title_text = prompt_font.render(">> MISSION_BRIEFING", True, CYAN_400)
+                title_text = render_text(prompt_font, ">> MISSION_BRIEFING", CYAN_400)
                 title_rect = title_text.get_rect(center=(current_width // 2, 40))
                 window.blit(title_text, title_rect)
                 
@@ -1321,20 +1726,15 @@ def run_game():
                 
                 # Wrap and display story text dynamically based on window width
                 wrapped_lines = wrap_text(visible_story, story_font, current_width - 100)
-                y_offset = 90
-                for line in wrapped_lines:
-                    line_surface = story_font.render(line, True, WHITE)
-                    window.blit(line_surface, (50, y_offset))
-                    y_offset += 30
+                streaming = story_stream_pos < len(opening_story)
+                y_offset, last_line_width = draw_story_lines(
+                    window, wrapped_lines, story_font, 50, 90, streaming
+                )
                 
                 # Show blinking cursor at the end if still streaming
-                if story_stream_pos < len(opening_story):
-                    cursor_x = 50
-                    if wrapped_lines:
-                        last_line = wrapped_lines[-1]
-                        last_line_surf = story_font.render(last_line, True, WHITE)
-                        cursor_x = 50 + last_line_surf.get_width()
-                    cursor_surf = story_font.render("_", True, CYAN_400)
+                if streaming:
+                    cursor_x = 50 + last_line_width
+                    cursor_surf = render_text(story_font, "_", CYAN_400)
                     # Blink cursor (every 500ms)
                     if (pygame.time.get_ticks() // 500) % 2 == 0:
                         window.blit(cursor_surf, (cursor_x, y_offset - 30))
@@ -1385,18 +1785,18 @@ def run_game():
                 begin_button_rect = begin_rect
         elif game_state == 'loading_ending':
             # Show loading screen while generating ending story
-            loading_text = prompt_font.render(">> ANALYZING_OUTCOME...", True, CYAN_400)
+            loading_text = render_text(prompt_font, ">> ANALYZING_OUTCOME...", CYAN_400)
             text_rect = loading_text.get_rect(center=(current_width // 2, current_height // 2 - 20))
             window.blit(loading_text, text_rect)
-            spinner_text = story_font.render(">> TIMELINE_CONVERGENCE_PROCESSING...", True, CYAN_700)
+            spinner_text = render_text(story_font, ">> TIMELINE_CONVERGENCE_PROCESSING...", CYAN_700)
             text_rect2 = spinner_text.get_rect(center=(current_width // 2, current_height // 2 + 20))
             window.blit(spinner_text, text_rect2)
         elif game_state == 'story_ending':
             # Display ending story with streaming effect
             if story_error:
-                error_text = prompt_font.render(">> ERROR", True, RED_500)
+                error_text = render_text(prompt_font, ">> ERROR", RED_500)
                 window.blit(error_text, (50, 50))
-                error_msg = story_font.render(f"{story_error}", True, RED_500)
+                error_msg = render_text(story_font, str(story_error), RED_500)
                 window.blit(error_msg, (50, 100))
             elif ending_story:
                 # Initialize streaming when ending story first appears
@@ -1411,7 +1811,7 @@ def run_game():
                 
                 result = ">> MISSION_SUCCESS" if grid.victor == 'Player' else ">> MISSION_FAILED"
                 color = GREEN_500 if grid.victor == 'Player' else RED_500
-                title_text = prompt_font.render(result, True, color)
+                title_text = render_text(prompt_font, result, color)
                 title_rect = title_text.get_rect(center=(current_width // 2, 40))
                 window.blit(title_text, title_rect)
                 
@@ -1420,20 +1820,15 @@ def run_game():
                 
                 # Wrap and display story text dynamically based on window width
                 wrapped_lines = wrap_text(visible_story, story_font, current_width - 100)
-                y_offset = 90
-                for line in wrapped_lines:
-                    line_surface = story_font.render(line, True, WHITE)
-                    window.blit(line_surface, (50, y_offset))
-                    y_offset += 30
+                streaming = story_stream_pos < len(ending_story)
+                y_offset, last_line_width = draw_story_lines(
+                    window, wrapped_lines, story_font, 50, 90, streaming
+                )
                 
                 # Show blinking cursor at the end if still streaming
-                if story_stream_pos < len(ending_story):
-                    cursor_x = 50
-                    if wrapped_lines:
-                        last_line = wrapped_lines[-1]
-                        last_line_surf = story_font.render(last_line, True, WHITE)
-                        cursor_x = 50 + last_line_surf.get_width()
-                    cursor_surf = story_font.render("_", True, CYAN_400)
+                if streaming:
+                    cursor_x = 50 + last_line_width
+                    cursor_surf = render_text(story_font, "_", CYAN_400)
                     # Blink cursor (every 500ms)
                     if (pygame.time.get_ticks() // 500) % 2 == 0:
                         window.blit(cursor_surf, (cursor_x, y_offset - 30))
@@ -1451,7 +1846,7 @@ def run_game():
                     window.blit(ending_image_surface, (img_x, image_y))
                 elif image_loading:
                     # Show loading indicator for image
-                    loading_img_text = story_font.render(">> GENERATING_IMAGE...", True, CYAN_700)
+                    loading_img_text = render_text(story_font, ">> GENERATING_IMAGE...", CYAN_700)
                     loading_img_rect = loading_img_text.get_rect(center=(current_width // 2, image_y + 100))
                     window.blit(loading_img_text, loading_img_rect)
                 
@@ -1466,23 +1861,15 @@ def run_game():
                 draw_cyberpunk_button(window, quit_rect, "QUIT", button_font, is_quit_hovered, 'red')
         elif game_state == 'difficulty_selection':
             # Draw difficulty selection buttons with cyberpunk styling
-            prompt_text = prompt_font.render(">> SELECT_DIFFICULTY", True, CYAN_400)
+            prompt_text = render_text(prompt_font, ">> SELECT_DIFFICULTY", CYAN_400)
             prompt_rect = prompt_text.get_rect(center=(current_width // 2, 60))
             window.blit(prompt_text, prompt_rect)
             # Center buttons horizontally
-            button_width, button_height = 250, 50
-            start_y = current_height // 2 - 100
-            button_x = (current_width - button_width) // 2
-            easy_rect = (button_x, start_y, button_width, button_height)
-            medium_rect = (button_x, start_y + 70, button_width, button_height)
-            hard_rect = (button_x, start_y + 140, button_width, button_height)
             mouse_pos = pygame.mouse.get_pos()
-            is_easy_hovered = check_button_click(mouse_pos[0], mouse_pos[1], easy_rect)
-            is_medium_hovered = check_button_click(mouse_pos[0], mouse_pos[1], medium_rect)
-            is_hard_hovered = check_button_click(mouse_pos[0], mouse_pos[1], hard_rect)
-            draw_cyberpunk_button(window, easy_rect, "EASY [5x5]", button_font, is_easy_hovered, 'green')
-            draw_cyberpunk_button(window, medium_rect, "MEDIUM [10x10]", button_font, is_medium_hovered, 'yellow')
-            draw_cyberpunk_button(window, hard_rect, "HARD [15x15]", button_font, is_hard_hovered, 'red')
+            button_rects = get_difficulty_button_rects(current_width, current_height)
+            for (_, label, scheme), (_, rect) in zip(DIFFICULTY_BUTTONS, button_rects):
+                is_hovered = check_button_click(mouse_pos[0], mouse_pos[1], rect)
+                draw_cyberpunk_button(window, rect, label, button_font, is_hovered, scheme)
         elif grid and game_state in ['bomb_placement', 'player_turn']:
             # Calculate layout: grid on left, chat on right, prompts above grid
             grid_pixel_width = GRID_WIDTH * CELL_SIZE
@@ -1495,14 +1882,11 @@ def run_game():
             
             # Draw prompt above grid
             if game_state == 'bomb_placement':
-                player_item = mission_data['player_item'] if mission_data else "bomb"
-                prompt_text = f"Hide your {player_item}"
-            elif game_state == 'player_turn':
-                if grid.player_turn:
-                    ai_item = mission_data['ai_item'] if mission_data else "target"
-                    prompt_text = f"Find the {ai_item}"
-                else:
-                    prompt_text = "AI's turn..."
+                prompt_text = hide_prompt
+            elif grid.player_turn:
+                prompt_text = find_prompt
+            else:
+                prompt_text = AI_TURN_PROMPT
             
             # Display timer and attempts above prompt (during player_turn only)
             if game_state == 'player_turn' and timer_start is not None:
@@ -1514,12 +1898,12 @@ def run_game():
                 # Timer text (cyberpunk styling)
                 timer_text = f"TIME: {int(remaining_time)}s"
                 timer_color = RED_500 if remaining_time < 10 else CYAN_400
-                timer_surf = prompt_font.render(timer_text, True, timer_color)
+                timer_surf = render_text(prompt_font, timer_text, timer_color)
                 
                 # Attempts text (more intuitive format, cyberpunk styling)
                 attempts_text = f"ATTEMPTS: {remaining_attempts}"
                 attempts_color = RED_500 if remaining_attempts <= 1 else CYAN_400
-                attempts_surf = prompt_font.render(attempts_text, True, attempts_color)
+                attempts_surf = render_text(prompt_font, attempts_text, attempts_color)
                 
                 # Position them side by side, centered above grid
                 total_width = timer_surf.get_width() + 50 + attempts_surf.get_width()
@@ -1529,7 +1913,7 @@ def run_game():
                 window.blit(attempts_surf, (start_x + timer_surf.get_width() + 50, grid_y_offset - 80))
             
             # Draw prompt with cyberpunk styling
-            prompt_surf = prompt_font.render(f">> {prompt_text.upper()}", True, CYAN_300)
+            prompt_surf = render_text(prompt_font, prompt_text, CYAN_300)
             prompt_x = grid_x_offset + (grid_pixel_width - prompt_surf.get_width()) // 2
             window.blit(prompt_surf, (prompt_x, grid_y_offset - 45))
             
@@ -1546,9 +1930,9 @@ def run_game():
                     opponent_ai, chat_input, chat_input_active, ai_response_loading,
                     button_font, small_font
                 )
-        # Update display and maintain 60 FPS
+        # Update display and cap the frame rate
         pygame.display.flip()
-        clock.tick(60)
+        clock.tick(FPS_BY_STATE.get(game_state, FPS))
     pygame.quit()
 
 
@@ -254,8 +254,10 @@ Respond naturally as if you're a sentient opponent in this scenario."""
                 f"Respond with ONLY the grid number, nothing else."
             )
             choice_text = self._generate_text(f"{system_prompt}\n\n{prompt}", max_output_tokens=10, temperature=0.7)
-            if choice_text:
-                grid_choice = int(''.join(filter(str.isdigit, choice_text)))
+            # Check for digits up front rather than letting int('') raise
+            digits = ''.join(filter(str.isdigit, choice_text or ''))
+            if digits:
+                grid_choice = int(digits)
                 if grid_choice in valid_targets:
                     return grid_choice
         except Exception: